@@ -2,8 +2,6 @@
 
 import importlib.metadata
 
-import pytest
-
 from .abstract_drive import AbstractDrive as AbstractDrive
 from .combined_drive import CombinedDrive as CombinedDrive
 from .data import Data as Data
@@ -26,6 +24,8 @@ def test():
     >>> # micromagneticdata.test()
 
     """
+    import pytest
+
     return pytest.main(
         ["-v", "--pyargs", "micromagneticdata", "-l"]
     )  # pragma: no cover
@@ -1,5 +1,6 @@
 import abc
-import contextlib
+import concurrent.futures
+import functools
 
 import discretisedfield as df
 import discretisedfield.plotting as dfp
@@ -7,6 +8,79 @@ import numpy as np
 import xarray as xr
 from discretisedfield.plotting.util import hv_key_dim
 
+# values at the beginning of the data block of binary OVF files
+_OVF_CHECK_VALUES = {4: 1234567.0, 8: 123456789012345.0}
+
+
+def _read_ovf_header(filename):
+    """Read the header of an OVF file.
+
+    Returns a dictionary with all header entries. Additional keys are ``ovf_v2``,
+    ``mode`` (``'binary'`` or ``'text'``), ``nbytes`` (binary only) and ``offset``, the
+    position of the first byte after the ``# Begin: Data`` line.
+
+    """
+    header = {}
+    with open(filename, "rb") as f:
+        header["ovf_v2"] = b"2.0" in next(f)
+        for line in f:
+            line = line.decode("utf-8")
+            if line.lower().startswith("# begin: data"):
+                header["mode"] = line.split()[3].lower()
+                if header["mode"] == "binary":
+                    header["nbytes"] = int(line.split()[-1])
+                header["offset"] = f.tell()
+                break
+            information = line[1:].split(":")  # remove leading `#`
+            if len(information) > 1:
+                header[information[0].strip()] = information[1].strip()
+    return header
+
+
+def _read_ovf_into(filename, out):
+    """Read the values of an OVF file into ``out``.
+
+    ``out`` must have the shape ``(*mesh.n, nvdim)``. The data block of binary files is
+    memory-mapped and copied directly into ``out``. Text files are parsed with
+    ``numpy.loadtxt``. No ``discretisedfield.Field`` is created.
+
+    """
+    header = _read_ovf_header(filename)
+    # valuedim is fixed to 3 and not in the header for OVF 1.0
+    nvdim = int(header["valuedim"]) if header["ovf_v2"] else 3
+    n = tuple(int(header[f"{i}nodes"]) for i in "xyz")
+    if out.shape != (*n, nvdim):
+        raise ValueError(
+            f"Cannot read file {filename}: shape {(*n, nvdim)} of the data does not"
+            f" match the expected shape {out.shape}."
+        )
+
+    if header["mode"] == "binary":
+        nbytes = header["nbytes"]
+        # OVF2 uses little-endian and OVF1 uses big-endian
+        dtype = np.dtype(f"{'<' if header['ovf_v2'] else '>'}f{nbytes}")
+        data = np.memmap(
+            filename,
+            dtype=dtype,
+            mode="r",
+            offset=header["offset"],
+            shape=(out.size + 1,),
+        )
+        if data[0] != _OVF_CHECK_VALUES[nbytes]:
+            raise ValueError(
+                f"Cannot read file {filename}. The file seems to be in binary format"
+                f" ({nbytes} bytes) but the check value is not correct: Expected"
+                f" {_OVF_CHECK_VALUES[nbytes]}, got {data[0]}."
+            )
+        data = data[1:]
+    else:
+        with open(filename, "rb") as f:
+            f.seek(header["offset"])
+            data = np.loadtxt(f, dtype=out.dtype, max_rows=out.size // nvdim)
+
+    # OVF stores the x index fastest
+    np.copyto(out, data.reshape(*reversed(n), nvdim).transpose(2, 1, 0, 3))
+
 
 class AbstractDrive(abc.ABC):
     """Drive class.
@@ -25,6 +99,8 @@ class AbstractDrive(abc.ABC):
 
     def __init__(self, callbacks=None):
         self._callbacks = callbacks or []
+        # (table, x, sorted) for the last table whose x column was checked
+        self._x_sorted_cache = None
 
     @abc.abstractmethod
     def __repr__(self):
@@ -114,6 +190,15 @@ class AbstractDrive(abc.ABC):
     def _m0_path(self):
         """Path to m0 file."""
 
+    @functools.cached_property
+    def _m0_mesh(self):
+        """Mesh of the initial magnetisation including its subregions.
+
+        The m0 file does not change, therefore it is read only once.
+
+        """
+        return self.m0.mesh
+
     @property
     @abc.abstractmethod
     def table(self):
@@ -197,14 +282,21 @@ class AbstractDrive(abc.ABC):
         Field(...)
 
         """
-        field = df.Field.from_file(filename=self._step_files[item])
-        if not field.mesh.region.allclose(self.m0.mesh.region):
+        return self._read_field(self._step_files[item])
+
+    def _read_field(self, filename):
+        """Read the field in ``filename`` and process it like ``__getitem__``."""
+        field = df.Field.from_file(filename=filename)
+        m0_mesh = self._m0_mesh
+        if not field.mesh.region.allclose(m0_mesh.region):
             # mumax3 (and maybe others) do not preserve the position of the origin
             field.mesh.translate(
-                self.m0.mesh.region.pmin - field.mesh.region.pmin, inplace=True
+                m0_mesh.region.pmin - field.mesh.region.pmin, inplace=True
             )
-        with contextlib.suppress(FileNotFoundError):
-            field.mesh.load_subregions(self._m0_path)
+        if m0_mesh.subregions:
+            # same as field.mesh.load_subregions(self._m0_path) without reading the
+            # json file for every step
+            field.mesh.subregions = m0_mesh.subregions
         field.valid = "norm"
         return self._apply_callbacks(field)
 
@@ -234,9 +326,10 @@ class AbstractDrive(abc.ABC):
 
         """
         # self.n and self._step_files might have different length from restart
-        # or if data is missing; therefore self._step_files is used
-        for i in range(len(self._step_files)):
-            yield self[i]
+        # or if data is missing; therefore self._step_files is used (and listed only
+        # once instead of once per step)
+        for filename in self._step_files:
+            yield self._read_field(filename)
 
     @property
     def callbacks(self):
@@ -288,7 +381,7 @@ class AbstractDrive(abc.ABC):
 
         """
 
-    def to_xarray(self, *args, **kwargs):
+    def to_xarray(self, *args, n_threads=None, lazy=False, dtype=None, **kwargs):
         """Export ``micromagneticdata.Drive`` as ``xarray.DataArray``
 
         The method depends on ``discretisedfield.Field.to_xarray`` and derives the last
@@ -310,12 +403,44 @@ class AbstractDrive(abc.ABC):
         ``micromagneticdata.Drive.info`` is returned as the output ``xarray.DataArray``
         attributes, besides the ones derived from ``discretisedfield.Field.to_xarray``.
 
+        The files of the individual steps are read concurrently using ``n_threads``
+        threads. With ``lazy=True`` the output is backed by a ``dask.array.Array`` with
+        one chunk per step and the files are only read when the data is computed. This
+        allows working with drives that do not fit into memory and requires ``dask``
+        to be installed.
+
+        The values are stored with the data type ``dtype``. By default, the data type of
+        ``discretisedfield.Field`` (``float64``) is used. For files stored in single
+        precision (e.g. the default of mumax3) ``dtype=numpy.float32`` halves the
+        memory without losing precision.
+
         Parameters
         ----------
         args: any
 
             Arguments to ``discretisedfield.Field.to_xarray``
 
+        n_threads: int, optional
+
+            Number of threads used to read the files. If ``None``, the default of
+            ``concurrent.futures.ThreadPoolExecutor`` is used, unless callbacks are
+            registered: registered callbacks are only run concurrently if
+            ``n_threads`` is passed explicitly, because they are not necessarily
+            thread-safe. It is ignored for ``lazy=True``. Defaults to ``None``.
+
+        lazy: bool, optional
+
+            If ``True``, return a dask-backed ``xarray.DataArray`` and read the
+            individual steps on demand. The single step of a drive with only one step
+            is read immediately. Registered callbacks are run when the data is
+            computed, possibly concurrently depending on the dask scheduler. Defaults
+            to ``False``.
+
+        dtype: numpy.dtype, optional
+
+            Data type of the values. If ``None``, the data type of the first
+            ``discretisedfield.Field`` is used. Defaults to ``None``.
+
         kwargs: any
 
             Named arguments to ``discretisedfield.Field.to_xarray``
@@ -345,46 +470,189 @@ class AbstractDrive(abc.ABC):
         <xarray.DataArray 'Mag' (t: 25, vdims: 3)>...
 
         """
-        if len(self._step_files) == 1:
-            darray = self[0].to_xarray(*args, **kwargs)
+        # table and info are read only once; without caching each access would
+        # re-read the respective file
+        info = self.info
+        # without caching every access to self._step_files lists the directory
+        step_files = self._step_files
+        if len(step_files) == 1:
+            darray = self._read_field(step_files[0]).to_xarray(*args, **kwargs)
+            if dtype is not None:
+                darray = darray.astype(dtype, copy=False)
+            if lazy:
+                import dask.array as da
+
+                # the single step is already read, it is only wrapped in one chunk
+                darray = darray.copy(data=da.from_array(darray.data, chunks=-1))
         else:
-            # xr.stack (below) is too slow and needs twice the amount of memory
-            # field_darrays = (field.to_xarray(*args, **kwargs) for field in self)
-            # darray = xr.concat(field_darrays, dim=self.table.data[self.table.x])
-            array = np.empty(
-                (self.n, *self[0].mesh.n, self[0].nvdim), dtype=self[0].array.dtype
-            )
-            for i, field in enumerate(self):
-                array[i] = field.array
-            # remove "comp" dimension for scalar fields
-            if self[0].nvdim == 1:
-                array = np.squeeze(array, axis=-1)
+            table = self.table
+            # the values of all steps are written into one preallocated array;
+            # concatenating individual DataArrays is slow and needs twice the memory
+            # the first field is read only once and reused for all metadata
+            field = self._read_field(step_files[0])
+            dtype = field.array.dtype if dtype is None else np.dtype(dtype)
+            if lazy:
+                array = self._lazy_array(field, step_files, len(table.data), dtype)
+            else:
+                shape = (len(table.data), *field.mesh.n, field.nvdim)
+                # no "comp" dimension for scalar fields
+                array = np.empty(shape[:-1] if field.nvdim == 1 else shape, dtype=dtype)
+                # view with the "comp" dimension to read the individual steps
+                values = array.reshape(shape)
+                if self._callbacks:
+                    values[0] = field.array
+                    start = 1
+                else:
+                    # discretisedfield parses text files differently (with rounding
+                    # errors); the first step is read again to use the same parser for
+                    # all steps
+                    start = 0
+                self._load_all_arrays(
+                    values, step_files, start=start, n_threads=n_threads
+                )
 
-            field_0 = self[0].to_xarray(*args, **kwargs)
+            field_0 = field.to_xarray(*args, **kwargs)
             coords = dict(field_0.coords)
-            coords[self.table.x] = self.table.data[self.table.x]
-
-            darray = xr.DataArray(
-                array, coords=coords, dims=[self.table.x, *field_0.dims]
-            )
-            darray[self.table.x].attrs["units"] = self.table.units[self.table.x]
-            if self.info["driver"] == "HysteresisDriver":
-                for i in "xyz":
-                    darray = darray.assign_coords(
-                        {
-                            f"B{i}_hysteresis": (
-                                "B_hysteresis",
-                                self.table.data[f"B{i}_hysteresis"],
-                            )
-                        }
-                    )
-                    darray[f"B{i}_hysteresis"].attrs["units"] = self.table.units[
-                        f"B{i}_hysteresis"
-                    ]
+            coords[table.x] = table.data[table.x]
+
+            darray = xr.DataArray(array, coords=coords, dims=[table.x, *field_0.dims])
+            darray[table.x].attrs["units"] = table.units[table.x]
+            if info["driver"] == "HysteresisDriver":
+                darray = darray.assign_coords(
+                    {
+                        f"B{i}_hysteresis": xr.Variable(
+                            "B_hysteresis",
+                            table.data[f"B{i}_hysteresis"].to_numpy(),
+                            attrs={"units": table.units[f"B{i}_hysteresis"]},
+                        )
+                        for i in "xyz"
+                    }
+                )
             darray.name = field_0.name
-            darray.assign_attrs(**field_0.attrs)
+            darray = darray.assign_attrs(**field_0.attrs)
+
+        return darray.assign_attrs(**info)
+
+    def to_zarr(self, store, **kwargs):
+        """Export ``micromagneticdata.Drive`` to a zarr store.
+
+        The drive is converted using ``micromagneticdata.Drive.to_xarray`` and written
+        to ``store``. Each step is stored as a separate chunk so that individual steps
+        can be read from the store without loading the whole drive. If ``dask`` is
+        installed, the steps are read and written one chunk at a time, which allows
+        converting drives that do not fit into memory. This method requires ``zarr``
+        to be installed.
+
+        Parameters
+        ----------
+        store : str, pathlib.Path, zarr store
 
-        return darray.assign_attrs(**self.info)
+            Store or path to the directory in which the data is saved.
+
+        kwargs: any
+
+            Named arguments to ``xarray.Dataset.to_zarr``
+
+        Returns
+        -------
+        xarray.DataArray
+
+            Lazily loaded data from ``store``, opened with ``xarray.open_zarr``.
+
+        Examples
+        --------
+        1. Drive to zarr
+
+        >>> import os
+        >>> import tempfile
+        >>> import xarray as xr
+        >>> import micromagneticdata as md
+        ...
+        >>> dirname = os.path.join(os.path.dirname(__file__), 'tests', 'test_sample')
+        >>> drive = md.Drive(name='rectangle', number=0, dirname=dirname)
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     store = os.path.join(tmpdir, 'drive.zarr')
+        ...     drive.to_zarr(store)  # doctest: +SKIP
+        <xarray.DataArray 'field' (t: 25, x: 20, y: 10, z: 4, vdims: 3)>...
+
+        """
+        try:
+            darray = self.to_xarray(lazy=True)
+        except ImportError:  # dask is not installed
+            darray = self.to_xarray()
+        chunks = darray.shape
+        if len(self._step_files) > 1:
+            chunks = (1, *chunks[1:])  # one chunk per step
+        darray.to_dataset().to_zarr(
+            store, encoding={darray.name: {"chunks": chunks}}, **kwargs
+        )
+        return xr.open_zarr(store, group=kwargs.get("group"))[darray.name]
+
+    def _load_all_arrays(self, array, step_files, start=0, n_threads=None):
+        """Read the values of ``step_files`` from ``start`` into ``array``.
+
+        The individual files are read concurrently using ``n_threads`` threads. Without
+        registered callbacks the values are read directly from the files into
+        ``array``; the additional processing done in ``__getitem__`` (alignment with
+        ``m0``, subregions, callbacks) does not change them. Registered callbacks are
+        only run concurrently if ``n_threads`` is given.
+
+        """
+
+        def load(i):
+            self._load_step(i, step_files, array[i])
+
+        if n_threads is None and self._callbacks:
+            n_threads = 1  # callbacks are not necessarily thread-safe
+        if n_threads == 1:
+            # no worker thread, e.g. for callbacks that have to run in the main thread
+            for i in range(start, len(step_files)):
+                load(i)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+            # consume the iterator to propagate exceptions from the threads
+            list(executor.map(load, range(start, len(step_files))))
+
+    def _lazy_array(self, field, step_files, n, dtype):
+        """Dask array of the values of the first ``n`` steps with one chunk per step.
+
+        ``field`` is the already read first step; it is reused if callbacks are
+        registered. All other steps are only read when the data is computed.
+
+        """
+        import dask
+        import dask.array as da
+
+        shape = (*field.mesh.n, field.nvdim)
+
+        def load(i):
+            out = np.empty(shape, dtype=dtype)
+            self._load_step(i, step_files, out)
+            return out
+
+        # same parser for all steps as in to_xarray
+        first = (
+            [da.from_array(field.array.astype(dtype, copy=False), chunks=-1)]
+            if self._callbacks
+            else []
+        )
+        array = da.stack(
+            first
+            + [
+                da.from_delayed(dask.delayed(load)(i), shape=shape, dtype=dtype)
+                for i in range(len(first), n)
+            ]
+        )
+        # remove "comp" dimension for scalar fields
+        return array[..., 0] if field.nvdim == 1 else array
+
+    def _load_step(self, i, step_files, out):
+        """Read the values of step ``i`` into ``out``."""
+        if self._callbacks:
+            out[...] = self._read_field(step_files[i]).array
+        else:
+            _read_ovf_into(step_files[i], out)
 
     @property
     def hv(self):
@@ -420,17 +688,42 @@ class AbstractDrive(abc.ABC):
 
     def _hv_data_selection(self, **kwargs):
         """Select one field for plotting in holoviews."""
-        if self.x in self._hv_key_dims:
+        table = self.table
+        data = table.data
+        # same condition as in self._hv_key_dims, which would require reading a field
+        if len(data) > 1:
             if self.x not in kwargs:
                 raise NotImplementedError(
                     f"The dimension {self.x} cannot be a key dimension"
                 )
             value = kwargs.pop(self.x)
-            n = self.table.data.loc[self.table.data[self.x] == value].index[0]
+            column = data[self.x]
+            n = None
+            if self._x_sorted(table):
+                # e.g. time or iteration: binary search instead of a full comparison
+                values = column.to_numpy()
+                n = int(np.searchsorted(values, value))
+                if n == len(values) or values[n] != value:
+                    n = None  # not in the column, handled like unsorted data
+            if n is None:
+                n = data.loc[column == value].index[0]
         else:
             n = -1
         return self[n]._hv_data_selection(**kwargs)
 
+    def _x_sorted(self, table):
+        """Check if the column of the independent variable in ``table`` is sorted.
+
+        The result is cached for the last checked table, so that it is computed only
+        once for a cached table.
+
+        """
+        cache = self._x_sorted_cache
+        if cache is None or cache[0] is not table or cache[1] != self.x:
+            cache = (table, self.x, table.data[self.x].is_monotonic_increasing)
+            self._x_sorted_cache = cache
+        return cache[2]
+
     def _hv_vdims_guess(self, kdims):
         """Try to find vector components matching the given kdims."""
         if self.x in kdims:
@@ -446,9 +739,10 @@ class AbstractDrive(abc.ABC):
 
         """
         key_dims = self[0]._hv_key_dims
-        if len(self.table.data) > 1:
+        table = self.table
+        if len(table.data) > 1:
             key_dims[self.x] = hv_key_dim(
-                self.table.data[self.x].to_numpy(),
-                self.table.units[self.x],
+                table.data[self.x].to_numpy(),
+                table.units[self.x],
             )
         return key_dims
@@ -1,12 +1,48 @@
 import functools
-import operator
+import itertools
 
+import pandas as pd
 import ubermagutil as uu
 
 import micromagneticdata as md
 from .abstract_drive import AbstractDrive
 
 
+def _merge_tables(tables, x):
+    """Merge tables on the independent variable ``x``.
+
+    The result is the same as ``functools.reduce(operator.lshift, tables)`` for tables
+    with independent variable ``x``: the column ``x`` of each table continues where
+    the one of the previous table ended. All data frames are concatenated at once
+    instead of copying the growing merged table for every additional table.
+
+    """
+    first = tables[0]
+    for table in tables[1:]:
+        if not isinstance(table, first.__class__):
+            msg = (
+                "Unsupported operand type(s) for <<:"
+                f" {type(first)=} and {type(table)=}."
+            )
+            raise TypeError(msg)
+    if first.attributes["fourierspace"]:
+        raise RuntimeError("Fourier transformed table does not support operand <<.")
+    frames = [first.data]
+    offset = first.data[x].iloc[-1]
+    for table in tables[1:]:
+        frame = table.data.copy()
+        # the independent variable continues where the previous table ended
+        frame[x] += offset
+        offset = frame[x].iloc[-1]
+        frames.append(frame)
+    return first.__class__(
+        data=pd.concat(frames, ignore_index=True),
+        units=first.units,
+        x=x,
+        attributes=first.attributes,
+    )
+
+
 @uu.inherit_docs
 class CombinedDrive(md.AbstractDrive):
     """Drive class for stacked drives.
@@ -52,19 +88,32 @@ class CombinedDrive(md.AbstractDrive):
             if not isinstance(drive, md.Drive):
                 raise TypeError(f"Object {drive}, {type(drive)=} is not of type Drive.")
 
-        self._table = functools.reduce(
-            operator.lshift, (drive.table for drive in drives)
-        )
+        # the merged table is only created when needed; the independent variable of
+        # each drive's table is drive.x, so no table has to be read for the check
+        table_x = drives[0].x
+        for drive in drives[1:]:
+            if drive.x != table_x:
+                raise ValueError(f"Independent variable {table_x!r} mismatch.")
         self.drives = drives
+        # the drives can be changed later (e.g. their x), the tables are merged on the
+        # independent variable at the time of combining
+        self._merge_x = table_x
 
         # self.name = name
         # self.number = number
-        self.x = self.table.x
+        self.x = table_x
 
     @AbstractDrive.x.setter
     def x(self, value):
-        if value in self.table.data.columns:
+        # the merged table contains the columns of all drives; the independent
+        # variable of the drives is one of them, so the tables are only read for other
+        # values
+        if value == self._merge_x or any(
+            value in drive.table.data.columns for drive in self.drives
+        ):
             self._x = value
+            if "table" in vars(self):  # merged table is already cached
+                self.table.x = value
         else:
             msg = f"Column {value=} does not exist in data."
             raise ValueError(msg)
@@ -98,11 +147,13 @@ class CombinedDrive(md.AbstractDrive):
         drives = ",\n".join(f"  {drive!r}" for drive in self.drives)
         return f"{self.__class__.__name__}(\n{drives}\n)"
 
-    @property
+    @functools.cached_property
     def info(self):
         """Drive information.
 
-        This property returns a dictionary with information about the drive.
+        This property returns a dictionary with information about the drive. It is
+        computed only once because the information of the individual drives does not
+        change.
 
         Returns
         -------
@@ -128,13 +179,44 @@ class CombinedDrive(md.AbstractDrive):
             "driver": self.drives[0].info["driver"],
         }
 
-    @property
+    @functools.cached_property
     def table(self):
-        return self._table
+        """Table object.
+
+        This property returns an ``ubermagtable.Table`` object containing the merged
+        tables of all drives. The independent variable of each drive continues where
+        the one of the previous drive ended. The table is only created on first
+        access.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Table object.
+
+        Examples
+        --------
+        1. Getting table object.
+
+        >>> import os
+        >>> import micromagneticdata as md
+        ...
+        >>> dirname = os.path.join(os.path.dirname(__file__), 'tests', 'test_sample')
+        >>> data = md.Data(name='rectangle', dirname=dirname)
+        >>> combined = data[0] << data[0]
+        >>> combined.table.data.shape[0] == 2 * data[0].n
+        True
+
+        """
+        table = _merge_tables([drive.table for drive in self.drives], self._merge_x)
+        table.x = self.x
+        return table
 
     @property
     def _step_files(self):
-        return sum((drive._step_files for drive in self.drives), start=[])
+        return list(
+            itertools.chain.from_iterable(drive._step_files for drive in self.drives)
+        )
 
     def __lshift__(self, other):
         if isinstance(other, md.Drive):
@@ -1,4 +1,4 @@
-import glob
+import concurrent.futures
 import os
 
 import ipywidgets
@@ -6,6 +6,7 @@ import pandas as pd
 import ubermagutil.typesystem as ts
 
 import micromagneticdata as md
+from .drive import _read_info
 
 
 @ts.typesystem(name=ts.Typed(expected_type=str), dirname=ts.Typed(expected_type=str))
@@ -102,7 +103,16 @@ class Data:
         >>> data.info
            drive_number...
         """
-        return pd.DataFrame.from_records([i.info for i in self])
+
+        # the info files are read directly without creating the drives
+        drive_paths = [
+            os.path.join(self.path, f"drive-{number}") for number in range(self.n)
+        ]
+        # reading the files is I/O bound
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return pd.DataFrame.from_records(
+                list(executor.map(_read_info, drive_paths))
+            )
 
     @property
     def n(self):
@@ -127,7 +137,8 @@ class Data:
         7
 
         """
-        return len(list(glob.iglob(os.path.join(self.path, "drive-*"))))
+        with os.scandir(self.path) as entries:
+            return sum(entry.name.startswith("drive-") for entry in entries)
 
     def __getitem__(self, item):
         """Get drive with number ``item``.
@@ -198,8 +209,9 @@ class Data:
         7
 
         """
-        for i in range(self.n):
-            yield self[i]
+        # the directory is scanned only once; self[i] would scan it for every drive
+        for number in range(self.n):
+            yield md.Drive(name=self.name, number=number, dirname=self.dirname)
 
     def selector(self, description="drive", **kwargs):
         """Widget for selecting drive.
@@ -1,8 +1,12 @@
 import abc
+import concurrent.futures
+import contextlib
 import copy
 import json
 import numbers
+import os
 import pathlib
+import re
 
 import discretisedfield as df
 import ipywidgets
@@ -12,6 +16,45 @@ import ubermagutil.typesystem as ts
 
 import micromagneticdata as md
 
+try:
+    import orjson
+except ImportError:  # optional, faster json parser
+    orjson = None
+
+_NUMBER = re.compile(r"\d+")
+
+
+def _step_file_key(path):
+    """Sort key for step files comparing all numbers in the path numerically.
+
+    The zero-padded step numbers in the file names can exceed their padding for long
+    simulations, e.g. ``m999999.ovf`` and ``m1000000.ovf``, which breaks a lexical
+    sort.
+
+    """
+    path = str(path)
+    return [int(number) for number in _NUMBER.findall(path)], path
+
+
+def _ovf2vtk(filename, vtkfilename):
+    """Convert a single OVF file to VTK; defined on module level to be picklable."""
+    df.Field.from_file(filename).to_file(vtkfilename)
+
+
+def _read_info(drive_path):
+    """Read the ``info.json`` file in ``drive_path``.
+
+    ``orjson`` is used if it is installed. It does not support all values accepted
+    by ``json`` (e.g. ``NaN``), therefore ``json`` is used as fallback.
+
+    """
+    with open(os.path.join(drive_path, "info.json"), "rb") as f:
+        content = f.read()
+    if orjson is not None:
+        with contextlib.suppress(orjson.JSONDecodeError):
+            return orjson.loads(content)
+    return json.loads(content)
+
 
 @uu.inherit_docs
 @ts.typesystem(
@@ -45,10 +88,11 @@ class Drive(md.AbstractDrive):
 
     use_cache : bool, optional
 
-        If ``True`` the Drive object will read tabular data and the names and number of
-        magnetisation files only once. Note: this prevents Drive to detect new data when
-        looking at the output of a running simulation. If set to ``False`` the data is
-        read every time the user accesses it. Defaults to ``False``.
+        If ``True`` the Drive object will read tabular data, drive information, and the
+        names and number of magnetisation files only once. Note: this prevents Drive to
+        detect new data when looking at the output of a running simulation. If set to
+        ``False`` the data is read every time the user accesses it. Defaults to
+        ``False``.
 
     Raises
     ------
@@ -83,7 +127,7 @@ class Drive(md.AbstractDrive):
         OOMMFDrive.
 
         """
-        if pathlib.Path(f"{dirname}/{name}/drive-{number}/{name}.out").exists():
+        if os.path.exists(f"{dirname}/{name}/drive-{number}/{name}.out"):
             return super().__new__(md.Mumax3Drive)
         else:
             return super().__new__(md.OOMMFDrive)
@@ -92,12 +136,14 @@ class Drive(md.AbstractDrive):
         # use kwargs to not expose the following additional internal arguments to users
         self._step_file_list = kwargs.pop("step_files", [])
         self._table = kwargs.pop("table", None)
+        self._info = kwargs.pop("info", None)
 
         super().__init__(**kwargs)
-        self.drive_path = pathlib.Path(f"{dirname}/{name}/drive-{number}")
-        if not self.drive_path.exists():
-            msg = f"Directory {self.drive_path!r} does not exist."
+        drive_path = f"{dirname}/{name}/drive-{number}"
+        if not os.path.exists(drive_path):
+            msg = f"Directory {pathlib.Path(drive_path)!r} does not exist."
             raise OSError(msg)
+        self.drive_path = pathlib.Path(drive_path)
 
         self.use_cache = use_cache
         self.name = name
@@ -107,7 +153,7 @@ class Drive(md.AbstractDrive):
 
     @property
     def use_cache(self):
-        """Use caching for scalar data and the list of magnetisation files.
+        """Use caching for scalar data, drive information and magnetisation file names.
 
         The existing cache is cleared when set to ``False``.
 
@@ -115,10 +161,11 @@ class Drive(md.AbstractDrive):
         ----------
         use_cache : bool
 
-            If ``True`` the Drive object will read tabular data and the names and number
-            of magnetisation files only once. Note: this prevents Drive to detect new
-            data when looking at the output of a running simulation. If set to ``False``
-            the data is read every time the user accesses it. Defaults to ``False``.
+            If ``True`` the Drive object will read tabular data, drive information, and
+            the names and number of magnetisation files only once. Note: this prevents
+            Drive to detect new data when looking at the output of a running simulation.
+            If set to ``False`` the data is read every time the user accesses it.
+            Defaults to ``False``.
 
         """
         return self._use_cache
@@ -128,6 +175,7 @@ class Drive(md.AbstractDrive):
         if not use_cache:
             self._step_file_list = []
             self._table = None
+            self._info = None
         self._use_cache = use_cache
 
     @property
@@ -148,6 +196,14 @@ class Drive(md.AbstractDrive):
             self._table = ut.Table.fromfile(str(self._table_path), x=self.x)
         return self._table
 
+    def _update_table_x(self):
+        """Use the current independent variable in the cached table."""
+        if self._table is not None and hasattr(self, "_x") and self._x != self._table.x:
+            # the cached table can be shared with other drives (e.g. after
+            # register_callback) and is therefore not modified in place
+            self._table = copy.copy(self._table)
+            self._table.x = self._x
+
     @property
     @abc.abstractmethod
     def _step_file_glob(self):
@@ -156,12 +212,17 @@ class Drive(md.AbstractDrive):
     @property
     def _step_files(self):
         if not self.use_cache:
-            return sorted(self._step_file_glob)
+            return self._sorted_step_files()
 
         if not self._step_file_list:
-            self._step_file_list = sorted(self._step_file_glob)
+            self._step_file_list = self._sorted_step_files()
         return self._step_file_list
 
+    def _sorted_step_files(self):
+        # comparing the precomputed keys is much faster than comparing pathlib.Path
+        # objects
+        return sorted(self._step_file_glob, key=_step_file_key)
+
     def __getitem__(self, item):
         """Magnetisation field of an individual step or subpart of the drive.
 
@@ -223,6 +284,7 @@ class Drive(md.AbstractDrive):
                 callbacks=self.callbacks,
                 step_files=step_files,
                 table=table,
+                info=self._info,
             )
         else:
             raise TypeError(f"{type(item)=} is not supported")
@@ -252,8 +314,15 @@ class Drive(md.AbstractDrive):
         {...}
 
         """
-        with (self.drive_path / "info.json").open() as f:
-            return json.load(f)
+        if not self.use_cache:
+            return self._read_info()
+
+        if self._info is None:
+            self._info = self._read_info()
+        return self._info
+
+    def _read_info(self):
+        return _read_info(self.drive_path)
 
     @property
     @abc.abstractmethod
@@ -283,11 +352,16 @@ class Drive(md.AbstractDrive):
         TODO add mumax3 output to the pre-computed data
         """
 
-    def ovf2vtk(self, dirname=None):
+    def ovf2vtk(self, dirname=None, n_processes=None):
         """OVF to VTK conversion.
 
         This method iterates through all magnetisation fields in the drive and
-        generates a VTK file for each of them.
+        generates a VTK file for each of them. With ``n_processes > 1`` the files are
+        converted in parallel using ``n_processes`` processes. On platforms that start
+        new processes with ``spawn`` (the default on Windows and macOS), this
+        requires the calling script to protect its entry point with ``if __name__ ==
+        "__main__":``. Starting the processes and importing ``discretisedfield`` in
+        them takes a few seconds, so this only pays off for large drives.
 
         Parameters
         ----------
@@ -296,6 +370,12 @@ class Drive(md.AbstractDrive):
 
             Directory in which files are saved.
 
+        n_processes : int, optional
+
+            Number of processes used for the conversion. If ``None`` or ``1``, the
+            files are converted one after the other in the current process. Defaults
+            to ``None``.
+
         Examples
         --------
         1. Iterating drive.
@@ -309,9 +389,20 @@ class Drive(md.AbstractDrive):
 
         """
         dirname = pathlib.Path(dirname) if dirname is not None else self.drive_path
-        for i, filename in enumerate(self._step_files):
-            vtkfilename = dirname / f"drive-{self.number}-{i:07d}.vtk"
-            df.Field.from_file(filename).to_file(vtkfilename)
+        step_files = self._step_files
+        vtkfilenames = [
+            dirname / f"drive-{self.number}-{i:07d}.vtk" for i in range(len(step_files))
+        ]
+        if n_processes is None or n_processes <= 1:
+            for filename, vtkfilename in zip(step_files, vtkfilenames):
+                _ovf2vtk(filename, vtkfilename)
+            return
+        # reading and writing the files is CPU bound
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_processes
+        ) as executor:
+            # consume the iterator to propagate exceptions from the processes
+            list(executor.map(_ovf2vtk, step_files, vtkfilenames))
 
     def slider(self, description="step", **kwargs):
         """Widget for selecting individual steps.
@@ -366,6 +457,8 @@ class Drive(md.AbstractDrive):
             x=self.x,
             callbacks=self.callbacks + [callback],
             use_cache=self.use_cache,
-            step_files=self._step_files,
-            table=self.table,
+            # only pass on what is already cached, the new drive reads the rest lazily
+            step_files=self._step_file_list,
+            table=self._table,
+            info=self._info,
         )
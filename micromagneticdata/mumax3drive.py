@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 import ubermagutil as uu
@@ -35,10 +36,11 @@ class Mumax3Drive(md.Drive):
 
     use_cache : bool, optional
 
-        If ``True`` the Drive object will read tabular data and the names and number of
-        magnetisation files only once. Note: this prevents Drive to detect new data when
-        looking at the output of a running simulation. If set to ``False`` the data is
-        read every time the user accesses it. Defaults to ``False``.
+        If ``True`` the Drive object will read tabular data, drive information, and the
+        names and number of magnetisation files only once. Note: this prevents Drive to
+        detect new data when looking at the output of a running simulation. If set to
+        ``False`` the data is read every time the user accesses it. Defaults to
+        ``False``.
 
     Raises
     ------
@@ -76,6 +78,10 @@ class Mumax3Drive(md.Drive):
         if value is None:
             # self.info["driver"] in ["TimeDriver", "RelaxDriver", "MinDriver"]:
             self._x = "t"
+        elif value in ("t", getattr(self, "_x", None)):
+            # the default and the current value are valid, reading the table to check
+            # them is not necessary
+            self._x = value
         else:
             # self.table reads self.x so self._x has to be defined first
             if hasattr(self, "_x"):
@@ -85,6 +91,7 @@ class Mumax3Drive(md.Drive):
             if value not in self.table.data.columns:
                 self._x = _x
                 raise ValueError(f"Column {value=} does not exist in data.")
+        self._update_table_x()
 
     @property
     def _table_path(self):
@@ -92,7 +99,11 @@ class Mumax3Drive(md.Drive):
 
     @property
     def _step_file_glob(self):
-        return self._mumax_output_path.glob("*.ovf")
+        return (
+            self._mumax_output_path / entry.name
+            for entry in os.scandir(self._mumax_output_path)
+            if entry.name.endswith(".ovf")
+        )
 
     @property
     def calculator_script(self):
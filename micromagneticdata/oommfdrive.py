@@ -1,8 +1,17 @@
+import os
+
 import ubermagutil as uu
 
 import micromagneticdata as md
 from .abstract_drive import AbstractDrive
 
+# default independent variable for the different OOMMF drivers
+_DEFAULT_X = {
+    "TimeDriver": "t",
+    "MinDriver": "iteration",
+    "HysteresisDriver": "B_hysteresis",
+}
+
 
 @uu.inherit_docs
 class OOMMFDrive(md.Drive):
@@ -33,10 +42,11 @@ class OOMMFDrive(md.Drive):
 
     use_cache : bool, optional
 
-        If ``True`` the Drive object will read tabular data and the names and number of
-        magnetisation files only once. Note: this prevents Drive to detect new data when
-        looking at the output of a running simulation. If set to ``False`` the data is
-        read every time the user accesses it. Defaults to ``False``.
+        If ``True`` the Drive object will read tabular data, drive information, and the
+        names and number of magnetisation files only once. Note: this prevents Drive to
+        detect new data when looking at the output of a running simulation. If set to
+        ``False`` the data is read every time the user accesses it. Defaults to
+        ``False``.
 
     Raises
     ------
@@ -62,12 +72,15 @@ class OOMMFDrive(md.Drive):
     @AbstractDrive.x.setter
     def x(self, value):
         if value is None:
-            if self.info["driver"] == "TimeDriver":
-                self._x = "t"
-            elif self.info["driver"] == "MinDriver":
-                self._x = "iteration"
-            elif self.info["driver"] == "HysteresisDriver":
-                self._x = "B_hysteresis"
+            driver = self.info["driver"]
+            if driver in _DEFAULT_X:
+                self._x = _DEFAULT_X[driver]
+        elif value == getattr(self, "_x", None) or value == _DEFAULT_X.get(
+            self.info["driver"]
+        ):
+            # the default and the current value are valid, reading the table to check
+            # them is not necessary
+            self._x = value
         else:
             # self.table reads self.x so self._x has to be defined first
             if hasattr(self, "_x"):
@@ -77,6 +90,7 @@ class OOMMFDrive(md.Drive):
             if value not in self.table.data.columns:
                 self._x = _x
                 raise ValueError(f"Column {value=} does not exist in data.")
+        self._update_table_x()
 
     @property
     def _table_path(self):
@@ -84,7 +98,11 @@ class OOMMFDrive(md.Drive):
 
     @property
     def _step_file_glob(self):
-        return self.drive_path.glob(f"{self.name}*.omf")
+        return (
+            self.drive_path / entry.name
+            for entry in os.scandir(self.drive_path)
+            if entry.name.startswith(self.name) and entry.name.endswith(".omf")
+        )
 
     @property
     def calculator_script(self):
@@ -1,4 +1,6 @@
+import functools
 import itertools
+import operator
 import os
 
 import discretisedfield as df
@@ -9,6 +11,7 @@ import xarray as xr
 from discretisedfield.tests.test_field import check_hv
 
 import micromagneticdata as md
+from micromagneticdata.combined_drive import _merge_tables
 
 
 class TestDrive:
@@ -35,6 +38,8 @@ class TestDrive:
             md.CombinedDrive(self.data[0])
         with pytest.raises(TypeError):
             md.CombinedDrive(self.data[0], "wrong type")
+        # the merged table is only created on first access
+        assert "table" not in vars(combined_drive)
 
     def test_repr(self):
         for combined in self.combined_drives:
@@ -52,6 +57,28 @@ class TestDrive:
         with pytest.raises(ValueError):
             self.combined_drives[0].x = "wrong"
 
+        # the merged table uses the current independent variable, also if it is
+        # already cached
+        combined = self.combined_drives[0]
+        assert combined.table.x == "mx"
+        combined.x = "my"
+        assert combined.table.x == "my"
+        assert combined.to_xarray().dims[0] == "my"
+
+    def test_x_drives_changed(self):
+        drive_0, drive_5 = self.data[0], self.data[5]
+        combined = drive_0 << drive_5
+        expected = (self.data[0] << self.data[5]).table.data["t"]
+        # the tables are merged on the independent variable at the time of combining
+        drive_0.x = "mx"
+        assert combined.table.data["t"].equals(expected)
+        assert combined.table.data["t"].is_monotonic_increasing
+        drive_5.x = "mx"
+        del combined.table  # create the merged table again
+        assert combined.table.data["t"].equals(expected)
+        assert combined.table.x == "t"
+        assert combined.to_xarray().dims[0] == "t"
+
     def test_info(self):
         for combined in self.combined_drives:
             assert isinstance(combined.info, dict)
@@ -62,6 +89,16 @@ class TestDrive:
                 "TimeDriver",
                 "HysteresisDriver",
             ]
+            assert combined.info is combined.info  # cached
+
+    def test_merge_tables(self):
+        tables = [self.data[i].table for i in [0, 1, 2]]
+        merged = _merge_tables(tables, "t")
+        expected = functools.reduce(operator.lshift, tables)
+        assert merged.x == expected.x
+        assert merged.data.equals(expected.data)
+        with pytest.raises(TypeError):
+            _merge_tables([tables[0], "wrong type"], "t")
 
     def test_m0(self):
         for drive in self.combined_drives:
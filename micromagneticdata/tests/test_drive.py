@@ -1,4 +1,7 @@
+import importlib.util
 import os
+import shutil
+import threading
 
 import discretisedfield as df
 import ipywidgets
@@ -9,6 +12,8 @@ import xarray as xr
 from discretisedfield.tests.test_field import check_hv
 
 import micromagneticdata as md
+from micromagneticdata.abstract_drive import _read_ovf_into
+from micromagneticdata.drive import _read_info, _step_file_key
 
 
 class TestDrive:
@@ -30,7 +35,7 @@ class TestDrive:
             assert isinstance(repr(drive), str)
             assert "Drive" in repr(drive)
 
-    def test_x(self):
+    def test_x(self, monkeypatch):
         for drive in self.data:
             assert isinstance(drive.x, str)
             assert drive.x in ["t", "iteration", "B_hysteresis"]
@@ -40,6 +45,29 @@ class TestDrive:
         with pytest.raises(ValueError):
             self.data[0].x = "wrong"
 
+        # the current and the default value are set without reading the table
+        drive = self.data[0]
+        drive.x = "mx"
+        monkeypatch.setattr(md.OOMMFDrive, "table", property(lambda self: 1 / 0))
+        drive.x = "mx"
+        drive.x = "t"
+        assert drive.x == "t"
+        with pytest.raises(ZeroDivisionError):
+            drive.x = "my"
+
+    def test_x_cached_table(self):
+        drive = md.Drive(self.name, 0, self.dirname, use_cache=True)
+        table = drive.table
+        callback_drive = drive.register_callback(lambda f: f.orientation)
+        drive.x = "mx"
+        assert drive.table.x == "mx"
+        assert drive.to_xarray().dims[0] == drive.x
+        # the table shared with other drives is not changed
+        assert table.x == "t"
+        assert callback_drive.table.x == "t"
+        drive.x = "t"
+        assert drive.to_xarray().dims[0] == "t"
+
     def test_info(self):
         for i, drive in enumerate(self.data):
             assert isinstance(drive.info, dict)
@@ -96,6 +124,12 @@ class TestDrive:
         for i in range(self.data[0].n):
             assert isinstance(self.data[0][i], df.Field)
 
+    def test_getitem_subregions(self):
+        # mumax3 drive: the field is translated to the region of m0
+        drive = self.data[1]
+        assert drive[0].mesh.subregions == drive.m0.mesh.subregions
+        assert "total" in drive[-1].mesh.subregions
+
     def test_getitem_slice(self):
         drive = self.data[0]
         assert drive.n == 25
@@ -138,7 +172,14 @@ class TestDrive:
         assert len(list(self.data[0])) == 25
 
     def test_ovf2vtk(self, tmp_path):
-        self.data[0].ovf2vtk(dirname=tmp_path)
+        drive = self.data[0]
+        for n_processes in [None, 2]:
+            dirname = tmp_path / str(n_processes)
+            dirname.mkdir()
+            drive.ovf2vtk(dirname=dirname, n_processes=n_processes)
+            assert len(list(dirname.glob("*.vtk"))) == drive.n
+            field = df.Field.from_file(dirname / "drive-0-0000003.vtk")
+            assert np.allclose(field.array, drive[3].array)
 
     def test_slider(self):
         for drive in self.data:
@@ -173,6 +214,7 @@ class TestDrive:
             assert all(
                 item in drive.to_xarray().attrs.items() for item in drive.info.items()
             )
+            assert drive.to_xarray().attrs["nvdim"] == drive[0].nvdim
             if len(drive._step_files) != 1:
                 assert len(drive.to_xarray()[drive.table.x]) == len(drive._step_files)
                 assert np.allclose(
@@ -189,6 +231,150 @@ class TestDrive:
                     for i in "xyz"
                 )
 
+    def test_to_zarr(self, tmp_path):
+        pytest.importorskip("zarr")
+        for drive in [self.data[0], self.data[3]]:
+            store = tmp_path / f"drive-{drive.number}.zarr"
+            # zarr_format=2 supports the string coordinate of the vector components
+            darray = drive.to_zarr(store, zarr_format=2)
+            xr.testing.assert_identical(darray, xr.open_zarr(store)["field"])
+            xr.testing.assert_allclose(darray.load(), drive.to_xarray())
+            if len(drive._step_files) > 1:
+                assert darray.encoding["chunks"] == (1, 20, 10, 4, 3)
+
+    def test_to_xarray_n_threads(self):
+        drive = self.data[0]
+        xr.testing.assert_identical(drive.to_xarray(n_threads=1), drive.to_xarray())
+        callback_drive = drive.register_callback(lambda f: f.orientation)
+        xr.testing.assert_identical(
+            callback_drive.to_xarray(n_threads=1), callback_drive.to_xarray(n_threads=4)
+        )
+
+        # callbacks are run serially in the calling thread by default
+        threads = set()
+
+        def callback(field):
+            threads.add(threading.get_ident())
+            return field
+
+        drive.register_callback(callback).to_xarray()
+        assert threads == {threading.get_ident()}
+
+    def test_step_files_listed_once(self, monkeypatch):
+        drive = self.data[0]
+        callback_drive = drive.register_callback(lambda f: f.orientation)
+        sorted_step_files = md.OOMMFDrive._sorted_step_files
+        calls = []
+
+        def counting(self):
+            calls.append(None)
+            return sorted_step_files(self)
+
+        monkeypatch.setattr(md.OOMMFDrive, "_sorted_step_files", counting)
+        for d in [drive, callback_drive]:
+            calls.clear()
+            d.to_xarray()
+            assert len(calls) == 1
+            calls.clear()
+            list(d)
+            assert len(calls) == 1
+
+    def test_to_xarray_dtype(self):
+        # OOMMF stores 8 bytes, mumax3 4 bytes; drive 3 has a single step
+        for drive in [self.data[0], self.data[1], self.data[3]]:
+            darray = drive.to_xarray(dtype=np.float32)
+            assert darray.dtype == np.float32
+            xr.testing.assert_allclose(darray.astype(np.float64), drive.to_xarray())
+        # no precision is lost for single precision files
+        xr.testing.assert_equal(
+            self.data[1].to_xarray(dtype=np.float32).astype(np.float64),
+            self.data[1].to_xarray(),
+        )
+
+    def test_to_xarray_lazy(self):
+        da = pytest.importorskip("dask.array")
+        drive = self.data[0]
+        darray = drive.to_xarray(lazy=True)
+        assert isinstance(darray.data, da.Array)
+        assert darray.chunks[0] == (1,) * len(drive.table.data)
+        xr.testing.assert_identical(darray.compute(), drive.to_xarray())
+
+        callback_drive = drive.register_callback(lambda f: f.orientation.x)
+        xr.testing.assert_identical(
+            callback_drive.to_xarray(lazy=True).compute(), callback_drive.to_xarray()
+        )
+
+        # single step
+        darray = self.data[3].to_xarray(lazy=True)
+        assert isinstance(darray.data, da.Array)
+        xr.testing.assert_identical(darray.compute(), self.data[3].to_xarray())
+
+    def test_to_xarray_text(self, tmp_path):
+        drive = self.data[0]
+        shutil.copytree(drive.drive_path, tmp_path / self.name / "drive-0")
+        text_drive = md.Drive(self.name, 0, str(tmp_path))
+        rng = np.random.default_rng()
+        values = []
+        for filename in text_drive._step_files:
+            field = df.Field.from_file(filename)
+            # random values are parsed differently by pandas (used in discretisedfield)
+            values.append(rng.random(field.array.shape))
+            field.update_field_values(values[-1])
+            field.to_file(filename, representation="txt")
+
+        # all steps, including the first one, are read with the same parser
+        darray = text_drive.to_xarray()
+        assert np.array_equal(darray.values, np.stack(values))
+        if importlib.util.find_spec("dask") is not None:
+            xr.testing.assert_identical(text_drive.to_xarray(lazy=True), darray)
+
+    def test_read_info(self, tmp_path):
+        assert _read_info(self.data[0].drive_path) == self.data[0].info
+        # NaN is not supported by orjson
+        (tmp_path / "info.json").write_text('{"a": NaN, "b": 1}')
+        info = _read_info(tmp_path)
+        assert np.isnan(info["a"])
+        assert info["b"] == 1
+
+    def test_step_file_key(self):
+        files = [
+            "drive-1/m1000000.ovf",
+            "drive-1/m999999.ovf",
+            "drive-1/m000002.ovf",
+        ]
+        assert sorted(files, key=_step_file_key) == [
+            "drive-1/m000002.ovf",
+            "drive-1/m999999.ovf",
+            "drive-1/m1000000.ovf",
+        ]
+        files = [
+            "drive-0/rectangle-Oxs_MinDriver-Magnetization-10-0000003.omf",
+            "drive-0/rectangle-Oxs_MinDriver-Magnetization-09-12345678.omf",
+            "drive-0/rectangle-Oxs_MinDriver-Magnetization-09-0000001.omf",
+        ]
+        assert sorted(files, key=_step_file_key) == [files[2], files[1], files[0]]
+
+    @pytest.mark.parametrize("representation", ["txt", "bin4", "bin8"])
+    @pytest.mark.parametrize("nvdim", [1, 3])
+    def test_read_ovf_into(self, tmp_path, representation, nvdim):
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(4e-9, 3e-9, 2e-9), cell=(1e-9, 1e-9, 1e-9))
+        value = np.random.default_rng().random((*mesh.n, nvdim))
+        filename = tmp_path / "field.ovf"
+        df.Field(mesh, nvdim=nvdim, value=value).to_file(
+            filename, representation=representation
+        )
+
+        out = np.empty((*mesh.n, nvdim))
+        _read_ovf_into(filename, out)
+        if representation == "txt":
+            # text files are read exactly, discretisedfield (pandas) has rounding errors
+            assert np.array_equal(out, value)
+        else:
+            assert np.array_equal(out, df.Field.from_file(filename).array)
+
+        with pytest.raises(ValueError):
+            _read_ovf_into(filename, np.empty((*mesh.n, nvdim + 1)))
+
     def test_hv(self):
         # time drive
         check_hv(
@@ -217,6 +403,21 @@ class TestDrive:
             ["DynamicMap [z,iteration]", "VectorField [x,y]"],
         )
 
+    def test_hv_data_selection(self):
+        drive = md.Drive(self.name, 0, self.dirname, use_cache=True)
+        t = drive.table.data["t"].to_numpy()
+        xr.testing.assert_identical(
+            drive._hv_data_selection(t=t[3]), drive[3]._hv_data_selection()
+        )
+        # sortedness is only checked once for the cached table
+        cache = drive._x_sorted_cache
+        assert cache[2]
+        drive._hv_data_selection(t=t[-1])
+        assert drive._x_sorted_cache is cache
+        # values between two steps are not silently mapped to the next step
+        with pytest.raises(IndexError):
+            drive._hv_data_selection(t=(t[3] + t[4]) / 2)
+
     def test_register_callback(self):
         for drive in self.data:
             drive_orientation = drive.register_callback(lambda field: field.orientation)
@@ -236,6 +437,17 @@ class TestDrive:
 
         assert len(processed.callbacks) == 2
 
+        # cached data is passed on, but the step files are not listed eagerly
+        drive = md.Drive(drive.name, drive.number, drive.dirname, use_cache=True)
+        processed = drive.register_callback(lambda f: f.orientation)
+        assert processed._step_file_list == []
+        assert len(processed._step_files) == 25
+        step_files = drive._step_files
+        table = drive.table
+        processed = drive.register_callback(lambda f: f.orientation)
+        assert processed._step_files is step_files
+        assert processed.table is table
+
     def test_cache(self, monkeypatch):
         ref = self.data[0]
         drive = md.Drive(ref.name, ref.number, ref.dirname, ref.x, use_cache=True)
@@ -281,3 +493,14 @@ class TestDrive:
         assert len(list(drive)) == 25
         assert isinstance(drive[0], df.Field)
         assert isinstance(drive.table, ut.Table)
+
+    def test_cache_info(self):
+        ref = self.data[0]
+        drive = md.Drive(ref.name, ref.number, ref.dirname, ref.x, use_cache=True)
+        assert drive.info is drive.info
+        assert drive.register_callback(lambda f: f).info == drive.info
+        assert drive[2:5].info == drive.info
+
+        drive.use_cache = False
+        assert drive.info is not drive.info
+        assert drive.info == ref.info